@@ -9,62 +9,290 @@ Usage:
     python claude-analyzer.py --help
 """
 
+import hashlib
+import heapq
 import json
+import mmap
 import os
+import pickle
+import stat
 import sys
 import argparse
 import webbrowser
 import subprocess
 from pathlib import Path
 from datetime import datetime, timezone
-from collections import defaultdict, Counter
+from collections import Counter
+from itertools import repeat
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import platform
+from string import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# orjson parses bytes directly and is several times faster; stdlib json is the fallback
+_json_loads = orjson.loads if orjson else json.loads
+
+def _json_dumps(obj):
+    """Serialize data to compact UTF-8 JSON for the dashboard, using orjson when available"""
+    if orjson:
+        # Counter keys such as a model of null or 42 are not strings; stdlib json accepts them too
+        data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    # The JSON is inlined in a <script> block, where "</script>" or "<!--<script" inside a
+    # string would end or derail it; \u escapes keep the markup characters out entirely
+    return data.replace(b'<', b'\\u003c').replace(b'>', b'\\u003e').replace(b'&', b'\\u0026')
+
+def _days_from_civil(year, month, day):
+    """Days since 1970-01-01 for a proleptic Gregorian date (Howard Hinnant's algorithm)"""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+# Month lengths for a common year; February 29th is checked separately
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _utc_timestamp_to_epoch(timestamp):
+    """Fast path for the YYYY-MM-DDTHH:MM:SS[.ffffff]Z form Claude writes, or None"""
+    # isdigit() also accepts non-ASCII digits (fullwidth, superscripts), so require ASCII first
+    if (len(timestamp) < 20 or not timestamp.isascii() or timestamp[-1] != 'Z'
+            or timestamp[4] != '-' or timestamp[7] != '-'
+            or timestamp[10] != 'T' or timestamp[13] != ':' or timestamp[16] != ':'):
+        return None
+    fraction = timestamp[19:-1]
+    if fraction and (fraction[0] != '.' or not fraction[1:].isdigit()):
+        return None
+    if not (timestamp[0:4] + timestamp[5:7] + timestamp[8:10]
+            + timestamp[11:13] + timestamp[14:16] + timestamp[17:19]).isdigit():
+        return None
+    
+    year, month, day = int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10])
+    hour, minute, second = int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+    if not (year >= 1 and 1 <= month <= 12 and day >= 1 and hour < 24 and minute < 60 and second < 60):
+        return None
+    # Days past the end of the month would silently roll over, so leave them to the general parser
+    if day > _DAYS_IN_MONTH[month - 1] and not (
+            month == 2 and day == 29 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return None
+    
+    seconds = (_days_from_civil(year, month, day) * 86400
+               + hour * 3600 + minute * 60 + second)
+    return seconds + float('0' + fraction) if fraction else float(seconds)
+
+# Timestamps repeat heavily across messages and conversations, so parse each string once;
+# the cache is bounded so long runs over many unique timestamps do not grow without limit
+@lru_cache(maxsize=1 << 16)
+def _timestamp_to_epoch(timestamp):
+    """Parse an ISO-8601 timestamp to epoch seconds, memoized by the raw string"""
+    if not isinstance(timestamp, str):
+        raise TypeError(f"timestamp is not a string: {timestamp!r}")
+    epoch = _utc_timestamp_to_epoch(timestamp)
+    if epoch is not None:
+        return epoch
+    
+    # Anything else (offsets, dates only, odd precision) goes through a general parser
+    if ciso8601:
+        parsed = ciso8601.parse_datetime(timestamp)
+    else:
+        parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        raise ValueError(f"timestamp has no UTC offset: {timestamp}")
+    return parsed.timestamp()
+
+def _epoch_millis(timestamp):
+    """Integer epoch milliseconds for a timestamp, or None when it is missing or unparseable"""
+    if not timestamp:
+        return None
+    try:
+        return round(_timestamp_to_epoch(timestamp) * 1000)
+    except (TypeError, ValueError):
+        pass
+    
+    # Naive timestamps have no offset; show them as UTC rather than dropping them
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+    return round(parsed.replace(tzinfo=parsed.tzinfo or timezone.utc).timestamp() * 1000)
+
+def _iter_lines(file_path):
+    """Yield raw lines of a file (newline included) straight out of an mmap"""
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return
+    
+    with mm:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        
+        # mmap.readline splits in C; the trailing newline is harmless to the JSON parser
+        yield from iter(mm.readline, b'')
+
+def _intern(value):
+    """Intern a repeated string field so every occurrence shares one object"""
+    return sys.intern(value) if type(value) is str else value
+
+def _date_key(timestamp):
+    """Return the YYYY-MM-DD prefix of an ISO-8601 timestamp without parsing it"""
+    if isinstance(timestamp, str) and len(timestamp) >= 10 and timestamp[4] == '-' and timestamp[7] == '-':
+        return timestamp[:10]
+    return None
+
+def _candidate_data_directories():
+    """Possible Claude data directories for this OS, in search order"""
+    system = platform.system()
+    home = Path.home()
+    
+    possible_paths = []
+    
+    if system == "Darwin":  # macOS
+        possible_paths = [
+            home / "Library" / "Application Support" / "claude" / "usage",
+            home / "Library" / "Application Support" / "claude-desktop" / "usage",
+            home / "Library" / "Application Support" / "Anthropic" / "Claude" / "usage",
+            home / ".claude" / "usage",
+        ]
+    elif system == "Linux":
+        possible_paths = [
+            home / ".config" / "claude" / "usage",
+            home / ".claude" / "usage",
+            home / ".local" / "share" / "claude" / "usage",
+        ]
+    elif system == "Windows":
+        appdata = Path(os.environ.get("APPDATA", home / "AppData" / "Roaming"))
+        localappdata = Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local"))
+        possible_paths = [
+            appdata / "claude" / "usage",
+            localappdata / "claude" / "usage",
+            appdata / "Anthropic" / "Claude" / "usage",
+        ]
+        
+    # Check for common development locations
+    possible_paths.extend([
+        Path.cwd() / "claude_usage_data",
+        home / "Downloads" / "claude_usage_data",
+        home / "Desktop" / "claude_usage_data",
+    ])
+    
+    return tuple(possible_paths)
+
+# The candidate list only depends on the OS and environment, so it is built once at import
+_DATA_DIR_CANDIDATES = _candidate_data_directories()
+
+def _has_data_files(path):
+    """Check whether a directory directly contains a .json or .jsonl file"""
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith(('.json', '.jsonl')) for entry in entries)
+    except OSError:
+        return False
+
+def _scan_data_files(data_dir):
+    """List the .json and .jsonl files directly inside a directory in a single scandir pass"""
+    json_files = []
+    jsonl_files = []
+    try:
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    json_files.append(Path(entry.path))
+                elif entry.name.endswith('.jsonl') and entry.is_file():
+                    jsonl_files.append(Path(entry.path))
+    except OSError:
+        pass
+    return json_files, jsonl_files
+
+# Parsed conversations are cached per data source and reused for files whose mtime and
+# size are unchanged; only metadata is stored, never message text. Bump the version
+# whenever the cached conversation format changes
+_CACHE_VERSION = 2
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'claude-analyzer'
+
+def _cache_file(source):
+    """Cache file for one data directory or single file"""
+    digest = hashlib.sha1(os.path.abspath(source).encode('utf-8')).hexdigest()[:16]
+    return _CACHE_DIR / f'conversations-{digest}.pickle'
+
+def _read_cache(cache_file):
+    """Load {path: ((mtime_ns, size), conversations)}, treating a missing or outdated cache as empty"""
+    try:
+        with open(cache_file, 'rb') as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == _CACHE_VERSION else {}
+
+def _write_cache(cache_file, entries):
+    """Atomically replace the cache file; failing to cache is never fatal"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((_CACHE_VERSION, entries), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not write cache {cache_file}: {e}")
+
+def _strip_messages(conversations):
+    """Conversation metadata for the cache; nothing after parsing reads the message bodies"""
+    return [
+        {key: value for key, value in conversation.items() if key != 'messages'}
+        for conversation in conversations
+    ]
+
+def _file_signature(file_path):
+    """(mtime_ns, size) identifying one version of a file, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+# Conversations with activity inside these windows are reported as active / recent
+_ACTIVE_WINDOW_SECONDS = 5 * 60
+_RECENT_WINDOW_SECONDS = 60 * 60
+
+# Project categories in priority order: the first category with any matching term wins
+_PROJECT_KEYWORDS = (
+    ('python', ('python', '.py', 'import ', 'def ')),
+    ('javascript', ('javascript', '.js', 'npm', 'node')),
+    ('react', ('react', 'jsx', 'component')),
+    ('web', ('html', 'css', 'web', 'website')),
+    ('debugging', ('debug', 'error', 'bug', 'fix')),
+    ('data', ('data', 'analysis', 'csv', 'pandas')),
+)
 
 class ClaudeAnalyzer:
+    __slots__ = ('conversations', 'usage_stats', 'session_data', 'single_file', 'use_cache', 'now')
+    
     def __init__(self):
         self.conversations = []
         self.usage_stats = {}
         self.session_data = {}
         self.single_file = None
+        self.use_cache = True
+        self.now = datetime.now(timezone.utc).timestamp()
         
     def find_claude_data_directory(self):
         """Auto-discover Claude data directory based on OS"""
-        system = platform.system()
-        home = Path.home()
-        
-        possible_paths = []
-        
-        if system == "Darwin":  # macOS
-            possible_paths = [
-                home / "Library" / "Application Support" / "claude" / "usage",
-                home / "Library" / "Application Support" / "claude-desktop" / "usage",
-                home / "Library" / "Application Support" / "Anthropic" / "Claude" / "usage",
-                home / ".claude" / "usage",
-            ]
-        elif system == "Linux":
-            possible_paths = [
-                home / ".config" / "claude" / "usage",
-                home / ".claude" / "usage",
-                home / ".local" / "share" / "claude" / "usage",
-            ]
-        elif system == "Windows":
-            appdata = Path(os.environ.get("APPDATA", home / "AppData" / "Roaming"))
-            localappdata = Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local"))
-            possible_paths = [
-                appdata / "claude" / "usage",
-                localappdata / "claude" / "usage",
-                appdata / "Anthropic" / "Claude" / "usage",
-            ]
-            
-        # Check for common development locations
-        possible_paths.extend([
-            Path.cwd() / "claude_usage_data",
-            home / "Downloads" / "claude_usage_data",
-            home / "Desktop" / "claude_usage_data",
-        ])
-        
-        for path in possible_paths:
-            if path.exists() and any(path.glob("*.json")):
+        for path in _DATA_DIR_CANDIDATES:
+            if _has_data_files(path):
                 print(f"📁 Found Claude data directory: {path}")
                 return path
                 
@@ -74,6 +302,9 @@ class ClaudeAnalyzer:
         """Load and parse Claude conversation data"""
         print(f"🔍 Scanning for conversation files in {data_dir}")
         
+        # One reference time for every status decision in this load
+        self.now = datetime.now(timezone.utc).timestamp()
+        
         # Handle single file mode
         if self.single_file:
             if self.single_file.suffix == '.json':
@@ -83,8 +314,7 @@ class ClaudeAnalyzer:
                 json_files = []
                 jsonl_files = [self.single_file]
         else:
-            json_files = list(Path(data_dir).glob("*.json"))
-            jsonl_files = list(Path(data_dir).glob("*.jsonl"))
+            json_files, jsonl_files = _scan_data_files(data_dir)
         
         if not json_files and not jsonl_files:
             print("❌ No JSON/JSONL files found in data directory")
@@ -92,43 +322,157 @@ class ClaudeAnalyzer:
             
         print(f"📚 Found {len(json_files)} JSON files and {len(jsonl_files)} JSONL files")
         
-        # Process JSON files
-        for file_path in json_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.process_conversation_file(data, file_path)
-            except Exception as e:
-                print(f"⚠️  Error processing {file_path.name}: {e}")
-                continue
-        
-        # Process JSONL files
-        for file_path in jsonl_files:
-            try:
-                self.process_jsonl_file(file_path)
-            except Exception as e:
-                print(f"⚠️  Error processing {file_path.name}: {e}")
-                continue
+        files = json_files + jsonl_files
+        
+        # Reuse conversations from files unchanged since the last run
+        cache_file = _cache_file(self.single_file or data_dir)
+        cached = _read_cache(cache_file) if self.use_cache else {}
+        signatures = {}
+        loaded = {}
+        stale_files = []
+        for file_path in files:
+            key = str(file_path)
+            signatures[key] = signature = _file_signature(file_path)
+            entry = cached.get(key)
+            if signature is not None and entry is not None and entry[0] == signature:
+                loaded[key] = entry[1]
+            else:
+                stale_files.append(file_path)
+        
+        if loaded:
+            print(f"♻️  Reusing {len(loaded)} unchanged files from cache")
+            # Status depends on the current time, so it is never taken from the cache
+            for conversations in loaded.values():
+                for conversation in conversations:
+                    conversation['status'] = self.determine_conversation_status(conversation)
+        
+        # Files are independent, so parse them on all cores when there is more than one
+        if len(stale_files) > 1:
+            # No more workers than files; batches of roughly a quarter of each worker's share
+            workers = min(len(stale_files), os.cpu_count() or 1)
+            chunksize = max(1, len(stale_files) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_load_file_conversations, stale_files, repeat(self.now), chunksize=chunksize)
+                for file_path, conversations in zip(stale_files, results):
+                    loaded[str(file_path)] = conversations
+        else:
+            for file_path in stale_files:
+                loaded[str(file_path)] = self.load_file(file_path)
+        
+        # Keep the original file order regardless of where each file came from;
+        # files that failed to load contribute nothing
+        for file_path in files:
+            self.conversations.extend(loaded[str(file_path)] or ())
+        
+        # Failed loads are left out so they are retried (and reported) on the next run
+        if self.use_cache and stale_files:
+            _write_cache(cache_file, {
+                key: (signature, _strip_messages(loaded[key]))
+                for key, signature in signatures.items()
+                if signature is not None and loaded[key] is not None
+            })
+    
+    def load_file(self, file_path):
+        """Load a single JSON or JSONL file into a list of conversations, or report the error and return None"""
+        try:
+            if file_path.suffix == '.json':
+                with open(file_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                return [self.process_conversation_file(data, file_path)]
+            return self.process_jsonl_file(file_path)
+        except Exception as e:
+            print(f"⚠️  Error processing {file_path.name}: {e}")
+            return None
     
     def process_jsonl_file(self, file_path):
         """Process JSONL file with Claude conversation data"""
-        conversations_by_session = defaultdict(list)
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    entry = json.loads(line.strip())
-                    session_id = entry.get('sessionId', f'session_{line_num}')
-                    conversations_by_session[session_id].append(entry)
-                except json.JSONDecodeError as e:
-                    print(f"⚠️  Error parsing line {line_num} in {file_path.name}: {e}")
-                    continue
+        conversations_by_session = {}
+        current_session = current_records = None
+        
+        for line_num, line in enumerate(_iter_lines(file_path), 1):
+            # Blank lines (e.g. a trailing empty line) carry no entry
+            if not line or line.isspace():
+                continue
+            
+            try:
+                entry = _json_loads(line)
+                session_id = _intern(entry.get('sessionId', f'session_{line_num}'))
+                
+                # Sessions are usually written contiguously, so only look up the
+                # session's record list when the session changes
+                if current_records is None or session_id != current_session:
+                    current_records = conversations_by_session.get(session_id)
+                    if current_records is None:
+                        current_records = conversations_by_session[session_id] = []
+                    current_session = session_id
+                
+                # Reduce each entry as it is read so raw entries are never held per session
+                current_records.append(self.extract_message_info(entry))
+            except json.JSONDecodeError as e:
+                print(f"⚠️  Error parsing line {line_num} in {file_path.name}: {e}")
+                continue
         
         # Process each session as a conversation
-        for session_id, entries in conversations_by_session.items():
-            self.process_session_entries(entries, session_id, file_path)
+        return [
+            self.process_session_entries(records, session_id, file_path)
+            for session_id, records in conversations_by_session.items()
+        ]
+    
+    def extract_message_info(self, entry):
+        """Reduce a JSONL entry to (sort key, message info, model)"""
+        get = entry.get
+        entry_type = get('type')
+        model = None
+        message_info = {
+            'role': _intern(get('type', 'unknown')),
+            'content': '',
+            'timestamp': get('timestamp'),
+            'tokens': 0
+        }
+        
+        # Extract message content based on entry type
+        if entry_type == 'user':
+            message_info['role'] = 'user'
+            message_content = get('message', {})
+            message_info['content'] = message_content.get('content', '')
+            
+        elif entry_type == 'assistant':
+            message_info['role'] = 'assistant'
+            message_data = get('message', {})
+            
+            # Extract model information
+            if message_data.get('model'):
+                model = _intern(message_data['model'])
+            
+            # Extract content from assistant message
+            content_parts = message_data.get('content', [])
+            if isinstance(content_parts, list):
+                text_content = []
+                for part in content_parts:
+                    if isinstance(part, dict):
+                        if part.get('type') == 'text':
+                            text_content.append(part.get('text', ''))
+                        elif part.get('type') == 'tool_use':
+                            # Include tool use information
+                            tool_name = part.get('name', 'unknown_tool')
+                            text_content.append(f"[Tool: {tool_name}]")
+                message_info['content'] = '\n'.join(text_content)
+            elif isinstance(content_parts, str):
+                message_info['content'] = content_parts
+            
+            # Extract token usage
+            usage = message_data.get('usage')
+            if usage:
+                usage_get = usage.get
+                message_info['tokens'] = usage_get('input_tokens', 0) + usage_get('output_tokens', 0)
+        
+        # Estimate tokens if not provided
+        if message_info['tokens'] == 0:
+            message_info['tokens'] = self.estimate_tokens(message_info['content'])
+        
+        return get('timestamp', ''), message_info, model
     
-    def process_session_entries(self, entries, session_id, file_path):
+    def process_session_entries(self, records, session_id, file_path):
         """Process entries from a single session"""
         conversation = {
             'id': session_id,
@@ -142,57 +486,12 @@ class ClaudeAnalyzer:
             'project_context': 'unknown'
         }
         
-        # Sort entries by timestamp
-        entries.sort(key=lambda x: x.get('timestamp', ''))
+        # Sort entries by timestamp (a C-level key; already-ordered sessions sort in one linear pass)
+        records.sort(key=itemgetter(0))
         
-        for entry in entries:
-            message_info = {
-                'role': entry.get('type', 'unknown'),
-                'content': '',
-                'timestamp': entry.get('timestamp'),
-                'tokens': 0
-            }
-            
-            # Extract message content based on entry type
-            if entry.get('type') == 'user':
-                message_info['role'] = 'user'
-                message_content = entry.get('message', {})
-                message_info['content'] = message_content.get('content', '')
-                
-            elif entry.get('type') == 'assistant':
-                message_info['role'] = 'assistant'
-                message_data = entry.get('message', {})
-                
-                # Extract model information
-                if message_data.get('model'):
-                    conversation['model'] = message_data['model']
-                
-                # Extract content from assistant message
-                content_parts = message_data.get('content', [])
-                if isinstance(content_parts, list):
-                    text_content = []
-                    for part in content_parts:
-                        if isinstance(part, dict):
-                            if part.get('type') == 'text':
-                                text_content.append(part.get('text', ''))
-                            elif part.get('type') == 'tool_use':
-                                # Include tool use information
-                                tool_name = part.get('name', 'unknown_tool')
-                                text_content.append(f"[Tool: {tool_name}]")
-                    message_info['content'] = '\n'.join(text_content)
-                elif isinstance(content_parts, str):
-                    message_info['content'] = content_parts
-                
-                # Extract token usage
-                usage = message_data.get('usage', {})
-                if usage:
-                    input_tokens = usage.get('input_tokens', 0)
-                    output_tokens = usage.get('output_tokens', 0)
-                    message_info['tokens'] = input_tokens + output_tokens
-            
-            # Estimate tokens if not provided
-            if message_info['tokens'] == 0:
-                message_info['tokens'] = self.estimate_tokens(message_info['content'])
+        for _, message_info, model in records:
+            if model:
+                conversation['model'] = model
             
             conversation['messages'].append(message_info)
             conversation['total_tokens'] += message_info['tokens']
@@ -204,10 +503,11 @@ class ClaudeAnalyzer:
                 conversation['last_activity'] = message_info['timestamp']
         
         # Determine status and context
+        conversation['message_count'] = len(conversation['messages'])
         conversation['status'] = self.determine_conversation_status(conversation)
         conversation['project_context'] = self.extract_project_context(conversation)
         
-        self.conversations.append(conversation)
+        return conversation
     
     def process_conversation_file(self, data, file_path):
         """Process individual conversation file"""
@@ -238,7 +538,7 @@ class ClaudeAnalyzer:
             if isinstance(msg, dict):
                 # Extract message details
                 message_info = {
-                    'role': msg.get('role', 'unknown'),
+                    'role': _intern(msg.get('role', 'unknown')),
                     'content': msg.get('content', ''),
                     'timestamp': msg.get('timestamp'),
                     'tokens': self.estimate_tokens(msg.get('content', ''))
@@ -249,7 +549,7 @@ class ClaudeAnalyzer:
                 
                 # Update model info
                 if 'model' in msg:
-                    conversation['model'] = msg['model']
+                    conversation['model'] = _intern(msg['model'])
                 
                 # Update timestamps
                 if message_info['timestamp']:
@@ -258,10 +558,11 @@ class ClaudeAnalyzer:
                     conversation['last_activity'] = message_info['timestamp']
         
         # Determine conversation status and project context
+        conversation['message_count'] = len(conversation['messages'])
         conversation['status'] = self.determine_conversation_status(conversation)
         conversation['project_context'] = self.extract_project_context(conversation)
         
-        self.conversations.append(conversation)
+        return conversation
     
     def estimate_tokens(self, text):
         """Rough token estimation (4 chars per token average)"""
@@ -276,12 +577,12 @@ class ClaudeAnalyzer:
             
         # Check if conversation ended recently (within last hour)
         try:
-            last_time = datetime.fromisoformat(conversation['last_activity'].replace('Z', '+00:00'))
-            time_diff = datetime.now(timezone.utc) - last_time
+            last_time = _timestamp_to_epoch(conversation['last_activity'])
+            elapsed = self.now - last_time
             
-            if time_diff.seconds < 300:  # 5 minutes
+            if elapsed < _ACTIVE_WINDOW_SECONDS:
                 return 'active'
-            elif time_diff.seconds < 3600:  # 1 hour  
+            elif elapsed < _RECENT_WINDOW_SECONDS:
                 return 'recent'
             else:
                 return 'inactive'
@@ -291,27 +592,20 @@ class ClaudeAnalyzer:
     def extract_project_context(self, conversation):
         """Extract project/topic context from conversation"""
         # Look for code patterns, file mentions, or common project terms
-        content_sample = ""
+        samples = []
         for msg in conversation['messages'][:3]:  # Check first few messages
-            content_sample += str(msg.get('content', ''))[:500]
+            content = msg.get('content', '')
+            if not isinstance(content, str):
+                content = str(content)
+            samples.append(content[:500])
         
-        content_lower = content_sample.lower()
+        content_lower = ''.join(samples).lower()
         
         # Project type detection
-        if any(term in content_lower for term in ['python', '.py', 'import ', 'def ']):
-            return 'python'
-        elif any(term in content_lower for term in ['javascript', '.js', 'npm', 'node']):
-            return 'javascript'  
-        elif any(term in content_lower for term in ['react', 'jsx', 'component']):
-            return 'react'
-        elif any(term in content_lower for term in ['html', 'css', 'web', 'website']):
-            return 'web'
-        elif any(term in content_lower for term in ['debug', 'error', 'bug', 'fix']):
-            return 'debugging'
-        elif any(term in content_lower for term in ['data', 'analysis', 'csv', 'pandas']):
-            return 'data'
-        else:
-            return 'general'
+        for project, terms in _PROJECT_KEYWORDS:
+            if any(term in content_lower for term in terms):
+                return project
+        return 'general'
     
     def analyze_usage_patterns(self):
         """Analyze usage patterns and generate statistics"""
@@ -320,30 +614,31 @@ class ClaudeAnalyzer:
             
         # Basic statistics
         total_conversations = len(self.conversations)
-        total_messages = sum(len(conv['messages']) for conv in self.conversations)
-        total_tokens = sum(conv['total_tokens'] for conv in self.conversations)
-        
-        # Model usage
-        models = Counter(conv['model'] for conv in self.conversations)
-        
-        # Project distribution  
-        projects = Counter(conv['project_context'] for conv in self.conversations)
+        total_messages = 0
+        total_tokens = 0
         
-        # Daily usage patterns
-        daily_usage = defaultdict(lambda: {'conversations': 0, 'tokens': 0})
+        # Model usage, project distribution, status distribution and daily usage patterns
+        models = Counter()
+        projects = Counter()
+        statuses = Counter()
+        daily_usage = {}
         
+        # One pass over the conversations updates every aggregate
         for conv in self.conversations:
-            if conv['created_at']:
-                try:
-                    date = datetime.fromisoformat(conv['created_at'].replace('Z', '+00:00')).date()
-                    date_str = date.strftime('%Y-%m-%d')
-                    daily_usage[date_str]['conversations'] += 1
-                    daily_usage[date_str]['tokens'] += conv['total_tokens']
-                except:
-                    continue
-        
-        # Status distribution
-        statuses = Counter(conv['status'] for conv in self.conversations)
+            tokens = conv['total_tokens']
+            total_messages += conv['message_count']
+            total_tokens += tokens
+            models[conv['model']] += 1
+            projects[conv['project_context']] += 1
+            statuses[conv['status']] += 1
+            
+            date_str = _date_key(conv['created_at'])
+            if date_str:
+                day = daily_usage.get(date_str)
+                if day is None:
+                    day = daily_usage[date_str] = {'conversations': 0, 'tokens': 0}
+                day['conversations'] += 1
+                day['tokens'] += tokens
         
         self.usage_stats = {
             'total_conversations': total_conversations,
@@ -351,7 +646,7 @@ class ClaudeAnalyzer:
             'total_tokens': total_tokens,
             'models': dict(models),
             'projects': dict(projects),
-            'daily_usage': dict(daily_usage),
+            'daily_usage': daily_usage,
             'statuses': dict(statuses),
             'avg_tokens_per_conversation': total_tokens / max(total_conversations, 1),
             'avg_messages_per_conversation': total_messages / max(total_conversations, 1)
@@ -360,29 +655,53 @@ class ClaudeAnalyzer:
     def generate_enhanced_html(self, output_file="claude_dashboard.html"):
         """Generate enhanced HTML dashboard"""
         
-        # Limit conversations for display (show most recent 50)
-        display_conversations = sorted(
-            self.conversations, 
-            key=lambda x: x.get('last_activity') or '1900-01-01T00:00:00Z', 
-            reverse=True
-        )[:50]
-        
-        # Clean up conversation content to avoid JSON issues
-        for conv in display_conversations:
-            for msg in conv.get('messages', []):
-                # Truncate very long messages and clean content
-                content = str(msg.get('content', ''))
-                if len(content) > 500:
-                    content = content[:497] + "..."
-                # Remove problematic characters
-                content = content.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                msg['content'] = content
-        
-        # Prepare data for JavaScript with proper escaping
-        conversations_json = json.dumps(display_conversations, indent=2, ensure_ascii=False)
-        stats_json = json.dumps(self.usage_stats, indent=2, ensure_ascii=False)
-        
-        html_content = f"""
+        # Limit conversations for display (show most recent 50) without sorting them all
+        display_conversations = heapq.nlargest(
+            50,
+            self.conversations,
+            key=lambda x: x.get('last_activity') or ''
+        )
+        
+        # The table only shows per-conversation metadata, so message bodies stay out of the page
+        display_conversations = [
+            {
+                'id': conv['id'],
+                'project_context': conv.get('project_context'),
+                'model': conv.get('model'),
+                'message_count': conv['message_count'],
+                'total_tokens': conv.get('total_tokens', 0),
+                # Epoch milliseconds: shorter than ISO text and sorted numerically in the page
+                'last_activity': _epoch_millis(conv.get('last_activity')),
+                'status': conv.get('status')
+            }
+            for conv in display_conversations
+        ]
+        
+        # The page is written in pieces so the embedded JSON is streamed straight to the file
+        stats = self.usage_stats
+        html_head = _DASHBOARD_HEAD.substitute(
+            update_time=datetime.now().strftime('%m/%d/%Y, %I:%M:%S %p'),
+            total_conversations=stats.get('total_conversations', 0),
+            total_messages=stats.get('total_messages', 0),
+            total_tokens=f"{stats.get('total_tokens', 0):,}",
+            project_count=len(stats.get('projects', {})),
+            avg_tokens=f"{stats.get('avg_tokens_per_conversation', 0):.0f}"
+        )
+        
+        # A 1 MiB buffer lets the pieces reach the disk in one or a few write() calls
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(html_head.encode('utf-8'))
+            f.write(_json_dumps(display_conversations))
+            f.write(_DASHBOARD_MIDDLE)
+            f.write(_json_dumps(stats))
+            f.write(_DASHBOARD_TAIL)
+            
+        print(f"✅ Enhanced dashboard generated: {output_file}")
+        return output_file
+
+# Dashboard page, built once at import and split around the embedded conversations and
+# stats JSON; only the header metrics are substituted per run
+_DASHBOARD_HEAD = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -391,206 +710,206 @@ class ClaudeAnalyzer:
     <title>Claude Usage Analytics Dashboard</title>
     <script src="./chart.min.js"></script>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #f8fafc;
             color: #1a202c;
             line-height: 1.6;
-        }}
+        }
         
-        .header {{
+        .header {
             background: white;
             border-bottom: 1px solid #e2e8f0;
             padding: 1rem 2rem;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             color: #2d3748;
             font-size: 1.5rem;
             margin-bottom: 0.5rem;
-        }}
+        }
         
-        .update-time {{
+        .update-time {
             color: #718096;
             font-size: 0.875rem;
-        }}
+        }
         
-        .metrics-bar {{
+        .metrics-bar {
             background: #4299e1;
             color: white;
             padding: 1rem 2rem;
             display: flex;
             gap: 2rem;
             flex-wrap: wrap;
-        }}
+        }
         
-        .metric {{
+        .metric {
             display: flex;
             flex-direction: column;
             align-items: center;
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             font-size: 1.5rem;
             font-weight: bold;
-        }}
+        }
         
-        .metric-label {{
+        .metric-label {
             font-size: 0.875rem;
             opacity: 0.9;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 2rem;
-        }}
+        }
         
-        .dashboard-grid {{
+        .dashboard-grid {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 2rem;
             margin-bottom: 2rem;
-        }}
+        }
         
-        .chart-container {{
+        .chart-container {
             background: white;
             border-radius: 8px;
             padding: 1.5rem;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .chart-title {{
+        .chart-title {
             font-size: 1.125rem;
             font-weight: 600;
             margin-bottom: 1rem;
             color: #2d3748;
-        }}
+        }
         
-        .conversations-section {{
+        .conversations-section {
             background: white;
             border-radius: 8px;
             padding: 1.5rem;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .filter-tabs {{
+        .filter-tabs {
             display: flex;
             gap: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
         
-        .filter-tab {{
+        .filter-tab {
             padding: 0.5rem 1rem;
             border: 1px solid #e2e8f0;
             background: #f7fafc;
             border-radius: 4px;
             cursor: pointer;
             font-size: 0.875rem;
-        }}
+        }
         
-        .filter-tab.active {{
+        .filter-tab.active {
             background: #4299e1;
             color: white;
             border-color: #4299e1;
-        }}
+        }
         
-        .conversations-table {{
+        .conversations-table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
         
         .conversations-table th,
-        .conversations-table td {{
+        .conversations-table td {
             text-align: left;
             padding: 0.75rem;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .conversations-table th {{
+        .conversations-table th {
             background: #f7fafc;
             font-weight: 600;
             color: #4a5568;
             font-size: 0.875rem;
-        }}
+        }
         
-        .conversations-table td {{
+        .conversations-table td {
             font-size: 0.875rem;
-        }}
+        }
         
-        .status-dot {{
+        .status-dot {
             display: inline-block;
             width: 8px;
             height: 8px;
             border-radius: 50%;
             margin-right: 0.5rem;
-        }}
+        }
         
-        .status-active {{
+        .status-active {
             background: #48bb78;
-        }}
+        }
         
-        .status-recent {{
+        .status-recent {
             background: #ed8936;  
-        }}
+        }
         
-        .status-inactive {{
+        .status-inactive {
             background: #a0aec0;
-        }}
+        }
         
-        .conversation-id {{
+        .conversation-id {
             font-family: monospace;
             color: #4299e1;
-        }}
+        }
         
-        .chart-canvas {{
+        .chart-canvas {
             max-height: 300px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .dashboard-grid {{
+        @media (max-width: 768px) {
+            .dashboard-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .metrics-bar {{
+            .metrics-bar {
                 flex-direction: column;
                 gap: 1rem;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>Claude Usage Analytics Dashboard</h1>
-        <div class="update-time">Last updated: {datetime.now().strftime('%m/%d/%Y, %I:%M:%S %p')}</div>
+        <div class="update-time">Last updated: $update_time</div>
     </div>
     
     <div class="metrics-bar">
         <div class="metric">
-            <div class="metric-value">{self.usage_stats.get('total_conversations', 0)}</div>
+            <div class="metric-value">$total_conversations</div>
             <div class="metric-label">conversations</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{self.usage_stats.get('total_messages', 0)}</div>
+            <div class="metric-value">$total_messages</div>
             <div class="metric-label">messages</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{self.usage_stats.get('total_tokens', 0):,}</div>
+            <div class="metric-value">$total_tokens</div>
             <div class="metric-label">tokens</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{len(self.usage_stats.get('projects', {}))}</div>
+            <div class="metric-value">$project_count</div>
             <div class="metric-label">projects</div>
         </div>
         <div class="metric">
-            <div class="metric-value">{self.usage_stats.get('avg_tokens_per_conversation', 0):.0f}</div>
+            <div class="metric-value">$avg_tokens</div>
             <div class="metric-label">avg tokens/conv</div>
         </div>
     </div>
@@ -641,156 +960,165 @@ class ClaudeAnalyzer:
     <script>
         // Data from Python with error handling
         let conversations = [];
-        let stats = {{}};
+        let stats = {};
         
-        try {{
-            conversations = {conversations_json};
-            stats = {stats_json};
-        }} catch (e) {{
+        try {
+            conversations = """)
+
+_DASHBOARD_MIDDLE = b""";
+            stats = """
+
+_DASHBOARD_TAIL = """;
+        } catch (e) {
             console.error('Error parsing data:', e);
             conversations = [];
-            stats = {{}};
-        }}
+            stats = {};
+        }
         
         // Initialize charts and table
-        document.addEventListener('DOMContentLoaded', function() {{
-            try {{
+        document.addEventListener('DOMContentLoaded', function() {
+            try {
                 initializeCharts();
                 initializeConversationsTable();
                 initializeFilters();
-            }} catch (e) {{
+            } catch (e) {
                 console.error('Error initializing dashboard:', e);
                 document.body.innerHTML = '<div style="padding: 20px; color: red;">Dashboard initialization failed: ' + e.message + '</div>';
-            }}
-        }});
+            }
+        });
         
-        function initializeCharts() {{
+        function initializeCharts() {
             // Token Usage Chart
             const tokenCtx = document.getElementById('tokenChart').getContext('2d');
-            const dailyUsage = stats.daily_usage || {{}};
+            const dailyUsage = stats.daily_usage || {};
             const dates = Object.keys(dailyUsage).sort();
             const tokenData = dates.map(date => dailyUsage[date].tokens || 0);
             
-            new Chart(tokenCtx, {{
+            new Chart(tokenCtx, {
                 type: 'line',
-                data: {{
+                data: {
                     labels: dates,
-                    datasets: [{{
+                    datasets: [{
                         label: 'Tokens',
                         data: tokenData,
                         borderColor: '#4299e1',
                         backgroundColor: 'rgba(66, 153, 225, 0.1)',
                         fill: true,
                         tension: 0.1
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        y: {{
+                    scales: {
+                        y: {
                             beginAtZero: true
-                        }}
-                    }}
-                }}
-            }});
+                        }
+                    }
+                }
+            });
             
             // Project Distribution Chart
             const projectCtx = document.getElementById('projectChart').getContext('2d');
-            const projects = stats.projects || {{}};
+            const projects = stats.projects || {};
             const projectLabels = Object.keys(projects);
             const projectData = Object.values(projects);
             
-            new Chart(projectCtx, {{
+            new Chart(projectCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: projectLabels,
-                    datasets: [{{
+                    datasets: [{
                         label: 'Conversations',
                         data: projectData,
                         backgroundColor: [
                             '#4299e1', '#48bb78', '#ed8936', '#9f7aea', 
                             '#38b2ac', '#f56565', '#ec4899', '#10b981'
                         ]
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
                     indexAxis: 'y'
-                }}
-            }});
-        }}
+                }
+            });
+        }
         
-        function initializeConversationsTable() {{
+        function initializeConversationsTable() {
             const tbody = document.getElementById('conversationsTableBody');
             renderConversations('all');
-        }}
+        }
         
-        function renderConversations(filter) {{
+        function renderConversations(filter) {
             const tbody = document.getElementById('conversationsTableBody');
             tbody.innerHTML = '';
             
+            // Build the rows off-document and attach them in one insertion
+            const fragment = document.createDocumentFragment();
+            
             let filteredConversations = conversations;
-            if (filter !== 'all') {{
+            if (filter !== 'all') {
                 filteredConversations = conversations.filter(conv => conv.status === filter);
-            }}
+            }
             
             // Sort by last activity (most recent first)
-            filteredConversations.sort((a, b) => {{
+            filteredConversations.sort((a, b) => {
                 if (!a.last_activity && !b.last_activity) return 0;
                 if (!a.last_activity) return 1;
                 if (!b.last_activity) return -1;
-                return new Date(b.last_activity) - new Date(a.last_activity);
-            }});
+                return b.last_activity - a.last_activity;
+            });
             
-            filteredConversations.forEach(conv => {{
+            filteredConversations.forEach(conv => {
                 const row = document.createElement('tr');
                 
-                const statusClass = `status-${{conv.status || 'inactive'}}`;
+                const statusClass = `status-${conv.status || 'inactive'}`;
                 const truncatedId = conv.id.substring(0, 12) + '...';
                 const lastActivity = conv.last_activity ? 
                     formatTimeAgo(conv.last_activity) : 'unknown';
                 
                 row.innerHTML = `
-                    <td class="conversation-id">${{truncatedId}}</td>
-                    <td>${{conv.project_context || 'unknown'}}</td>
-                    <td>${{(conv.model || 'unknown').substring(0, 20)}}...</td>
-                    <td>${{conv.messages.length}}</td>
-                    <td>${{conv.total_tokens.toLocaleString()}}</td>
-                    <td>${{lastActivity}}</td>
-                    <td><span class="status-dot ${{statusClass}}"></span>${{conv.status || 'unknown'}}</td>
+                    <td class="conversation-id">${truncatedId}</td>
+                    <td>${conv.project_context || 'unknown'}</td>
+                    <td>${(conv.model || 'unknown').substring(0, 20)}...</td>
+                    <td>${conv.message_count}</td>
+                    <td>${conv.total_tokens.toLocaleString()}</td>
+                    <td>${lastActivity}</td>
+                    <td><span class="status-dot ${statusClass}"></span>${conv.status || 'unknown'}</td>
                 `;
                 
-                tbody.appendChild(row);
-            }});
-        }}
+                fragment.appendChild(row);
+            });
+            
+            tbody.appendChild(fragment);
+        }
         
-        function formatTimeAgo(timestamp) {{
-            try {{
+        function formatTimeAgo(timestamp) {
+            try {
                 const date = new Date(timestamp);
                 const now = new Date();
                 const diffMs = now - date;
                 const diffMins = Math.floor(diffMs / 60000);
                 
                 if (diffMins < 1) return 'now';
-                if (diffMins < 60) return `${{diffMins}}m ago`;
+                if (diffMins < 60) return `${diffMins}m ago`;
                 
                 const diffHours = Math.floor(diffMins / 60);
-                if (diffHours < 24) return `${{diffHours}}h ago`;
+                if (diffHours < 24) return `${diffHours}h ago`;
                 
                 const diffDays = Math.floor(diffHours / 24);
-                return `${{diffDays}}d ago`;
-            }} catch {{
+                return `${diffDays}d ago`;
+            } catch {
                 return 'unknown';
-            }}
-        }}
+            }
+        }
         
-        function initializeFilters() {{
+        function initializeFilters() {
             const filterTabs = document.querySelectorAll('.filter-tab');
             
-            filterTabs.forEach(tab => {{
-                tab.addEventListener('click', function() {{
+            filterTabs.forEach(tab => {
+                tab.addEventListener('click', function() {
                     // Remove active class from all tabs
                     filterTabs.forEach(t => t.classList.remove('active'));
                     
@@ -800,19 +1128,19 @@ class ClaudeAnalyzer:
                     // Render conversations with filter
                     const filter = this.dataset.filter;
                     renderConversations(filter);
-                }});
-            }});
-        }}
+                });
+            });
+        }
     </script>
 </body>
 </html>
-"""
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
-        print(f"✅ Enhanced dashboard generated: {output_file}")
-        return output_file
+""".encode('utf-8')
+
+def _load_file_conversations(file_path, now):
+    """Worker entry point: parse one file and return its conversations (None on failure)"""
+    analyzer = ClaudeAnalyzer()
+    analyzer.now = now
+    return analyzer.load_file(file_path)
 
 def main():
     parser = argparse.ArgumentParser(description='Claude Usage Analyzer - Enhanced Dashboard Generator')
@@ -820,8 +1148,11 @@ def main():
     parser.add_argument('--data-dir', type=str, help='Path to Claude usage data directory')
     parser.add_argument('--output', type=str, default='claude_dashboard.html', help='Output HTML file name')
     parser.add_argument('--open', action='store_true', help='Open dashboard in browser after generation')
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse every file instead of reusing cached results')
     
     args = parser.parse_args()
+    # Resolved once, so the write, the browser URI and the final message share one path
+    args.output = str(Path(args.output).resolve())
     
     if not args.auto and not args.data_dir:
         print("❌ Please specify either --auto or --data-dir")
@@ -829,6 +1160,7 @@ def main():
         return 1
     
     analyzer = ClaudeAnalyzer()
+    analyzer.use_cache = not args.no_cache
     
     # Find or use specified data directory/file
     if args.auto:
@@ -839,12 +1171,15 @@ def main():
             return 1
     else:
         data_path = Path(args.data_dir)
-        if not data_path.exists():
+        # One stat() answers both "does it exist" and "is it a file"
+        try:
+            mode = os.stat(data_path).st_mode
+        except OSError:
             print(f"❌ Data path not found: {data_path}")
             return 1
         
         # If it's a single file, use its parent directory and process only that file
-        if data_path.is_file():
+        if stat.S_ISREG(mode):
             if data_path.suffix in ['.json', '.jsonl']:
                 print(f"📁 Processing single file: {data_path}")
                 data_dir = data_path.parent
@@ -868,7 +1203,7 @@ def main():
     # Open in browser if requested
     if args.open:
         print(f"🌐 Opening dashboard in browser...")
-        webbrowser.open(f"file://{os.path.abspath(output_file)}")
+        webbrowser.open(Path(output_file).as_uri())
     
     print(f"🎉 Analysis complete! Dashboard available at: {output_file}")
     